@@ -0,0 +1,65 @@
+"""
+Numba-compiled aggregation kernels for scaling pattern analysis.
+
+The hourly and daily reductions in ScheduleGenerator.analyze_patterns are
+bucketed sums, maxima, and counts over parallel columns. With numba
+installed they compile to a single fused machine-code pass per call;
+without it the caller keeps its vectorized bincount path and these
+plain-Python definitions stay unused.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _bucket_stats(keys: "np.ndarray", cpu: "np.ndarray", mem: "np.ndarray", rps: "np.ndarray", pods: "np.ndarray", nslots: int):
+    """
+    Accumulate per-bucket sums, pod maxima, and counts in one fused pass.
+
+    Args:
+        keys: Bucket index per sample (hour of day or weekday)
+        cpu: CPU utilization column
+        mem: Memory utilization column
+        rps: Request rate column
+        pods: Pod count column
+        nslots: Number of buckets (24 for hours, 7 for weekdays)
+
+    Returns:
+        Tuple of (sum_cpu, sum_mem, sum_rps, sum_pods, max_pods, counts)
+    """
+    sum_cpu = np.zeros(nslots)
+    sum_mem = np.zeros(nslots)
+    sum_rps = np.zeros(nslots)
+    sum_pods = np.zeros(nslots)
+    max_pods = np.zeros(nslots)
+    counts = np.zeros(nslots, np.int64)
+    for i in range(keys.shape[0]):
+        k = keys[i]
+        sum_cpu[k] += cpu[i]
+        sum_mem[k] += mem[i]
+        sum_rps[k] += rps[i]
+        sum_pods[k] += pods[i]
+        if pods[i] > max_pods[k]:
+            max_pods[k] = pods[i]
+        counts[k] += 1
+    return sum_cpu, sum_mem, sum_rps, sum_pods, max_pods, counts
+
+
+if NUMBA_AVAILABLE:
+    _bucket_stats = njit(cache=True)(_bucket_stats)
+
+
+def hourly_stats(hours, cpu, mem, rps, pods):
+    """Bucket the columns by hour of day (24 slots) in one fused pass."""
+    return _bucket_stats(hours, cpu, mem, rps, pods, 24)
+
+
+def daily_stats(dow, cpu, mem, rps, pods):
+    """Bucket the columns by weekday (7 slots) in one fused pass."""
+    return _bucket_stats(dow, cpu, mem, rps, pods, 7)
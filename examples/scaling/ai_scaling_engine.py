@@ -32,6 +32,17 @@ scaling_analysis_latency = Histogram(
 tracer = trace.get_tracer(__name__)
 
 
+def pretty(obj) -> str:
+    """Format an object's fields as indented lines for demo output.
+
+    Walks the instance attributes directly, avoiding the to_dict() and
+    json.dumps() round-trip for human-readable printing. Handles both
+    __dict__-backed and __slots__-backed objects.
+    """
+    names = getattr(obj, "__slots__", None) or vars(obj)
+    return "\n".join(f"  {name}: {getattr(obj, name)}" for name in names)
+
+
 class ScalingMetrics:
     """Container for current system metrics."""
 
@@ -404,7 +415,7 @@ def main():
     )
 
     decision = engine.analyze_metrics(normal_metrics)
-    print(json.dumps(decision.to_dict(), indent=2))
+    print(pretty(decision))
 
     # Example 2: High load spike
     print("\n2. HIGH LOAD SPIKE SCENARIO")
@@ -421,7 +432,7 @@ def main():
     )
 
     decision = engine.analyze_metrics(spike_metrics)
-    print(json.dumps(decision.to_dict(), indent=2))
+    print(pretty(decision))
 
     # Example 3: Over-provisioned
     print("\n3. OVER-PROVISIONED SCENARIO")
@@ -438,7 +449,7 @@ def main():
     )
 
     decision = engine.analyze_metrics(over_provisioned_metrics)
-    print(json.dumps(decision.to_dict(), indent=2))
+    print(pretty(decision))
 
     # Example 4: Memory constrained
     print("\n4. MEMORY CONSTRAINED SCENARIO")
@@ -455,7 +466,7 @@ def main():
     )
 
     decision = engine.analyze_metrics(memory_constrained_metrics)
-    print(json.dumps(decision.to_dict(), indent=2))
+    print(pretty(decision))
 
     print("\n" + "=" * 60)
     print("Note: Set ANTHROPIC_API_KEY environment variable to enable AI-based decisions.")
@@ -5,16 +5,90 @@ This module analyzes historical metrics to identify patterns and generate
 optimal scaling schedules for predictable workload variations.
 """
 
+import bisect
+import itertools
 import json
-from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+from _hourly_kernel import NUMBA_AVAILABLE, daily_stats, hourly_stats
 from ai_scaling_engine import AIScalingEngine, ScalingMetrics
 from opentelemetry import trace
 
 tracer = trace.get_tracer(__name__)
 
+# Weekday-index -> display name, applied only when reports are assembled;
+# the analysis itself stays on integer weekday() keys
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Interned cron day-field suffixes; every entry reuses one of these three
+_CRON_ANY_DAY = "* * *"
+_CRON_WEEKEND = "* * 0,6"  # Sunday and Saturday
+_CRON_WEEKDAY = "* * 1-5"  # Monday to Friday
+
+
+class MetricsBatch:
+    """
+    Columnar storage for a metrics history.
+
+    Holds the hot fields as parallel NumPy arrays (~30 bytes per sample)
+    instead of (timestamp, ScalingMetrics) tuples (~400 bytes each), so
+    large histories stay cache resident and the analysis consumes the
+    columns directly with no per-sample extraction.
+    """
+
+    __slots__ = ("hours", "dow", "cpu", "memory", "rps", "pods", "ts")
+
+    def __init__(self, hours, dow, cpu, memory, rps, pods, ts):
+        self.hours = hours
+        self.dow = dow
+        self.cpu = cpu
+        self.memory = memory
+        self.rps = rps
+        self.pods = pods
+        self.ts = ts
+
+    def __len__(self) -> int:
+        return self.cpu.shape[0]
+
+    @classmethod
+    def from_history(cls, metrics_history: List[Tuple[datetime, ScalingMetrics]]) -> "MetricsBatch":
+        """Pack (timestamp, metrics) tuples into columns in one pass."""
+        count = len(metrics_history)
+        hours = np.empty(count, dtype=np.int64)
+        dow = np.empty(count, dtype=np.int64)
+        cpu = np.empty(count, dtype=np.float64)
+        memory = np.empty(count, dtype=np.float64)
+        rps = np.empty(count, dtype=np.float64)
+        pods = np.empty(count, dtype=np.float64)
+        ts = np.empty(count, dtype=np.int64)
+        for i, (timestamp, metrics) in enumerate(metrics_history):
+            hours[i] = timestamp.hour
+            dow[i] = timestamp.weekday()
+            cpu[i] = metrics.cpu_utilization
+            memory[i] = metrics.memory_utilization
+            rps[i] = metrics.request_rate
+            pods[i] = metrics.current_pod_count
+            ts[i] = int(timestamp.timestamp() * 1e9)
+        return cls(hours, dow, cpu, memory, rps, pods, ts)
+
+    def select(self, mask: "np.ndarray") -> "MetricsBatch":
+        """Return the subset of samples where mask is true."""
+        return MetricsBatch(
+            self.hours[mask],
+            self.dow[mask],
+            self.cpu[mask],
+            self.memory[mask],
+            self.rps[mask],
+            self.pods[mask],
+            self.ts[mask],
+        )
+
+
+# A history is either the ergonomic tuple form or a packed MetricsBatch
+MetricsHistory = Union[List[Tuple[datetime, ScalingMetrics]], MetricsBatch]
+
 
 class ScalingSchedule:
     """Represents a time-based scaling schedule."""
@@ -23,6 +97,13 @@ class ScalingSchedule:
         self.name = name
         self.description = description
         self.schedule_entries: List[Dict[str, Any]] = []
+        # Parallel sorted key list for bisect inserts; bisect.insort only
+        # grew a key= parameter in Python 3.10 and the repo supports 3.8+
+        self._entry_times: List[str] = []
+        # Derived views cached until the next add_entry; repeat to_dict and
+        # to_cron_jobs calls on an unchanged schedule are reference returns
+        self._entries_cache: Optional[List[Dict[str, Any]]] = None
+        self._cron_cache: Optional[Tuple[str, List[Dict[str, str]]]] = None
 
     def add_entry(
         self, time: str, target_pods: int, reason: str, day_of_week: Optional[str] = None, confidence: float = 1.0
@@ -46,14 +127,44 @@ class ScalingSchedule:
         if day_of_week:
             entry["day_of_week"] = day_of_week
 
-        self.schedule_entries.append(entry)
+        # Derive the cron expression once at insert time; to_cron_jobs then
+        # just reads the cached key instead of re-parsing every entry per call.
+        # Entries with an invalid time keep no "_cron" key and are skipped there.
+        try:
+            hour, minute = time.split(":")
+            if not (0 <= int(hour) <= 23 and 0 <= int(minute) <= 59):
+                raise ValueError(f"Time out of range: {time}")
+
+            suffix = _CRON_ANY_DAY
+            if day_of_week:
+                lowered = day_of_week.lower()
+                if lowered == "weekend":
+                    suffix = _CRON_WEEKEND
+                elif lowered == "weekday":
+                    suffix = _CRON_WEEKDAY
+
+            entry["_cron"] = f"{minute} {hour} {suffix}"
+        except ValueError as e:
+            print(f"Warning: Schedule entry has invalid time: {e}")
+
+        # Keep the list sorted on insert so to_dict never re-sorts; the
+        # parallel key list gives bisect a plain sorted sequence to search
+        index = bisect.bisect(self._entry_times, time)
+        self._entry_times.insert(index, time)
+        self.schedule_entries.insert(index, entry)
+        self._entries_cache = None
+        self._cron_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert schedule to dictionary format."""
+        if self._entries_cache is None:
+            self._entries_cache = [
+                {k: v for k, v in entry.items() if not k.startswith("_")} for entry in self.schedule_entries
+            ]
         return {
             "name": self.name,
             "description": self.description,
-            "schedule_entries": sorted(self.schedule_entries, key=lambda x: x["time"]),
+            "schedule_entries": self._entries_cache,
         }
 
     def to_cron_jobs(self, deployment_name: str = "ai-inference-service") -> List[Dict[str, str]]:
@@ -66,41 +177,28 @@ class ScalingSchedule:
         Returns:
             List of CronJob configurations
         """
+        if self._cron_cache is not None and self._cron_cache[0] == deployment_name:
+            return self._cron_cache[1]
+
         cron_jobs = []
 
         for entry in self.schedule_entries:
-            try:
-                time_parts = entry["time"].split(":")
-                if len(time_parts) != 2:
-                    raise ValueError(f"Invalid time format: {entry['time']}")
-
-                hour, minute = time_parts
-                # Validate ranges
-                if not (0 <= int(hour) <= 23 and 0 <= int(minute) <= 59):
-                    raise ValueError(f"Time out of range: {entry['time']}")
-
-                # Basic cron expression (minute hour * * *)
-                cron_expr = f"{minute} {hour} * * *"
-
-                # Adjust for day of week if specified
-                if "day_of_week" in entry:
-                    if entry["day_of_week"].lower() == "weekend":
-                        cron_expr = f"{minute} {hour} * * 0,6"  # Sunday and Saturday
-                    elif entry["day_of_week"].lower() == "weekday":
-                        cron_expr = f"{minute} {hour} * * 1-5"  # Monday to Friday
-
-                cron_jobs.append(
-                    {
-                        "schedule": cron_expr,
-                        "target_pods": entry["target_pods"],
-                        "reason": entry["reason"],
-                        "kubectl_command": f"kubectl scale deployment {deployment_name} --replicas={entry['target_pods']}",
-                    }
-                )
-            except (ValueError, KeyError) as e:
-                print(f"Warning: Skipping invalid schedule entry: {e}")
+            # Cron expression was derived and validated in add_entry
+            cron_expr = entry.get("_cron")
+            if cron_expr is None:
+                print(f"Warning: Skipping invalid schedule entry: {entry['time']}")
                 continue
 
+            cron_jobs.append(
+                {
+                    "schedule": cron_expr,
+                    "target_pods": entry["target_pods"],
+                    "reason": entry["reason"],
+                    "kubectl_command": f"kubectl scale deployment {deployment_name} --replicas={entry['target_pods']}",
+                }
+            )
+
+        self._cron_cache = (deployment_name, cron_jobs)
         return cron_jobs
 
 
@@ -124,12 +222,13 @@ class ScheduleGenerator:
         """
         self.scaling_engine = scaling_engine or AIScalingEngine()
 
-    def analyze_patterns(self, metrics_history: List[Tuple[datetime, ScalingMetrics]]) -> Dict[str, Any]:
+    def analyze_patterns(self, metrics_history: MetricsHistory) -> Dict[str, Any]:
         """
         Analyze historical metrics to identify patterns.
 
         Args:
-            metrics_history: List of (timestamp, metrics) tuples
+            metrics_history: History as (timestamp, metrics) tuples or a
+                packed MetricsBatch
 
         Returns:
             Dictionary with pattern analysis
@@ -137,46 +236,76 @@ class ScheduleGenerator:
         with tracer.start_as_current_span("analyze_patterns") as span:
             span.set_attribute("metrics_count", len(metrics_history))
 
-            if not metrics_history:
+            if not len(metrics_history):
                 return {"error": "No metrics history provided"}
 
-            # Group metrics by hour of day
-            hourly_patterns = defaultdict(list)
-            daily_patterns = defaultdict(list)
-
-            for timestamp, metrics in metrics_history:
-                hour = timestamp.hour
-                day_of_week = timestamp.strftime("%A")
-
-                hourly_patterns[hour].append(metrics)
-                daily_patterns[day_of_week].append(metrics)
+            # Work on parallel columns (SoA): each reduction below is one C
+            # loop over a flat array instead of Python sums over buckets of
+            # ScalingMetrics objects. Tuple histories are packed once here.
+            if not isinstance(metrics_history, MetricsBatch):
+                metrics_history = MetricsBatch.from_history(metrics_history)
+            hours = metrics_history.hours
+            dow = metrics_history.dow
+            cpu = metrics_history.cpu
+            memory = metrics_history.memory
+            rps = metrics_history.rps
+            pods = metrics_history.pods
+
+            # Bucket sums and counts via bincount; per-hour averages fall out
+            # of a single elementwise divide over the occupied slots
+            if NUMBA_AVAILABLE:
+                # Fused machine-code pass: all six hourly outputs in one loop
+                hour_cpu, hour_memory, hour_rps, hour_pods, hour_max_pods, hour_counts = hourly_stats(
+                    hours, cpu, memory, rps, pods
+                )
+            else:
+                hour_counts = np.bincount(hours, minlength=24)
+                hour_cpu = np.bincount(hours, weights=cpu, minlength=24)
+                hour_memory = np.bincount(hours, weights=memory, minlength=24)
+                hour_rps = np.bincount(hours, weights=rps, minlength=24)
+                hour_pods = np.bincount(hours, weights=pods, minlength=24)
+                hour_max_pods = np.zeros(24)
+                np.maximum.at(hour_max_pods, hours, pods)
+
+            occupied = np.nonzero(hour_counts)[0]
+            hour_cpu_avg = hour_cpu[occupied] / hour_counts[occupied]
+            hour_rps_avg = hour_rps[occupied] / hour_counts[occupied]
 
-            # Calculate average metrics per hour
             hourly_averages = {}
-            for hour, metrics_list in hourly_patterns.items():
-                hourly_averages[hour] = {
-                    "cpu": sum(m.cpu_utilization for m in metrics_list) / len(metrics_list),
-                    "memory": sum(m.memory_utilization for m in metrics_list) / len(metrics_list),
-                    "rps": sum(m.request_rate for m in metrics_list) / len(metrics_list),
-                    "avg_pods": sum(m.current_pod_count for m in metrics_list) / len(metrics_list),
-                    "max_pods": max(m.current_pod_count for m in metrics_list),
+            for hour in occupied:
+                n = hour_counts[hour]
+                hourly_averages[int(hour)] = {
+                    "cpu": float(hour_cpu[hour] / n),
+                    "memory": float(hour_memory[hour] / n),
+                    "rps": float(hour_rps[hour] / n),
+                    "avg_pods": float(hour_pods[hour] / n),
+                    "max_pods": int(hour_max_pods[hour]),
                 }
 
-            # Calculate average metrics per day of week
+            if NUMBA_AVAILABLE:
+                day_cpu, day_memory, day_rps, day_pods, _, day_counts = daily_stats(dow, cpu, memory, rps, pods)
+            else:
+                day_counts = np.bincount(dow, minlength=7)
+                day_cpu = np.bincount(dow, weights=cpu, minlength=7)
+                day_memory = np.bincount(dow, weights=memory, minlength=7)
+                day_rps = np.bincount(dow, weights=rps, minlength=7)
+                day_pods = np.bincount(dow, weights=pods, minlength=7)
+
             daily_averages = {}
-            for day, metrics_list in daily_patterns.items():
-                daily_averages[day] = {
-                    "cpu": sum(m.cpu_utilization for m in metrics_list) / len(metrics_list),
-                    "memory": sum(m.memory_utilization for m in metrics_list) / len(metrics_list),
-                    "rps": sum(m.request_rate for m in metrics_list) / len(metrics_list),
-                    "avg_pods": sum(m.current_pod_count for m in metrics_list) / len(metrics_list),
+            for day in np.nonzero(day_counts)[0]:
+                n = day_counts[day]
+                daily_averages[_DAY_NAMES[day]] = {
+                    "cpu": float(day_cpu[day] / n),
+                    "memory": float(day_memory[day] / n),
+                    "rps": float(day_rps[day] / n),
+                    "avg_pods": float(day_pods[day] / n),
                 }
 
             # Identify peak hours
-            peak_hours = self._identify_peak_hours(hourly_averages)
+            peak_hours = self._identify_peak_hours(occupied, hour_cpu_avg, hour_rps_avg)
 
             # Identify low-traffic periods
-            low_hours = self._identify_low_hours(hourly_averages)
+            low_hours = self._identify_low_hours(occupied, hour_cpu_avg, hour_rps_avg)
 
             span.set_attribute("peak_hours_count", len(peak_hours))
 
@@ -189,13 +318,14 @@ class ScheduleGenerator:
             }
 
     def generate_schedule(
-        self, metrics_history: List[Tuple[datetime, ScalingMetrics]], min_pods: int = 2, max_pods: int = 20
+        self, metrics_history: MetricsHistory, min_pods: int = 2, max_pods: int = 20
     ) -> ScalingSchedule:
         """
         Generate a scaling schedule from historical metrics.
 
         Args:
-            metrics_history: List of (timestamp, metrics) tuples
+            metrics_history: History as (timestamp, metrics) tuples or a
+                packed MetricsBatch
             min_pods: Minimum number of pods
             max_pods: Maximum number of pods
 
@@ -216,22 +346,28 @@ class ScheduleGenerator:
 
             # Generate schedule entries based on hourly patterns
             hourly_averages = patterns["hourly_patterns"]
+            hours_sorted = sorted(hourly_averages)
+
+            # Recommended pod counts for all hours in one clipped vector
+            # expression instead of per-hour divisions, max calls, and clamps
+            n_hours = len(hours_sorted)
+            cpu24 = np.fromiter((hourly_averages[h]["cpu"] for h in hours_sorted), dtype=np.float64, count=n_hours)
+            mem24 = np.fromiter((hourly_averages[h]["memory"] for h in hours_sorted), dtype=np.float64, count=n_hours)
+            avg_pods24 = np.fromiter(
+                (hourly_averages[h]["avg_pods"] for h in hours_sorted), dtype=np.float64, count=n_hours
+            )
+            # Target 70% CPU, 80% memory
+            scaling = np.maximum(1.0, np.maximum(cpu24 / 70.0, mem24 / 80.0))
+            recommended = np.clip((avg_pods24 * scaling).astype(np.int32), min_pods, max_pods)
 
-            for hour in sorted(hourly_averages.keys()):
-                metrics = hourly_averages[hour]
-
-                # Calculate recommended pods based on average load
-                cpu_factor = metrics["cpu"] / 70.0  # Target 70% CPU
-                memory_factor = metrics["memory"] / 80.0  # Target 80% memory
-
-                scaling_factor = max(cpu_factor, memory_factor)
-                recommended_pods = int(metrics["avg_pods"] * max(1.0, scaling_factor))
+            # O(1) membership instead of rebuilding the peak list per hour
+            peak_set = frozenset(h["hour"] for h in patterns["peak_hours"])
 
-                # Clamp to min/max
-                recommended_pods = max(min_pods, min(max_pods, recommended_pods))
+            for hour, rec in zip(hours_sorted, recommended):
+                recommended_pods = int(rec)
 
                 # Add buffer for peaks (pre-scale 30 minutes before high load)
-                is_peak = hour in [h["hour"] for h in patterns["peak_hours"]]
+                is_peak = hour in peak_set
 
                 if is_peak:
                     # Pre-scale 30 minutes before peak hour
@@ -259,38 +395,42 @@ class ScheduleGenerator:
             return schedule
 
     def generate_weekly_schedule(
-        self, metrics_history: List[Tuple[datetime, ScalingMetrics]], min_pods: int = 2, max_pods: int = 20
+        self, metrics_history: MetricsHistory, min_pods: int = 2, max_pods: int = 20
     ) -> Dict[str, ScalingSchedule]:
         """
         Generate separate schedules for weekdays and weekends.
 
         Args:
-            metrics_history: List of (timestamp, metrics) tuples
+            metrics_history: History as (timestamp, metrics) tuples or a
+                packed MetricsBatch
             min_pods: Minimum number of pods
             max_pods: Maximum number of pods
 
         Returns:
             Dictionary with 'weekday' and 'weekend' schedules
         """
-        # Separate metrics by weekday vs weekend
-        weekday_metrics = []
-        weekend_metrics = []
-
-        for timestamp, metrics in metrics_history:
-            if timestamp.weekday() < 5:  # Monday = 0, Friday = 4
-                weekday_metrics.append((timestamp, metrics))
-            else:
-                weekend_metrics.append((timestamp, metrics))
+        # Separate metrics by weekday vs weekend. A packed batch splits into
+        # zero-copy-built column subsets; the tuple form computes the mask
+        # once and partitions with two C-loop compress passes.
+        if isinstance(metrics_history, MetricsBatch):
+            mask = metrics_history.dow < 5  # Monday = 0, Friday = 4
+            weekday_metrics = metrics_history.select(mask)
+            weekend_metrics = metrics_history.select(~mask)
+        else:
+            dow = np.fromiter((t.weekday() for t, _ in metrics_history), dtype=np.int8, count=len(metrics_history))
+            mask = dow < 5  # Monday = 0, Friday = 4
+            weekday_metrics = list(itertools.compress(metrics_history, mask))
+            weekend_metrics = list(itertools.compress(metrics_history, ~mask))
 
         schedules = {}
 
-        if weekday_metrics:
+        if len(weekday_metrics):
             weekday_schedule = self.generate_schedule(weekday_metrics, min_pods, max_pods)
             weekday_schedule.name = "weekday-schedule"
             weekday_schedule.description = "Scaling schedule for Monday-Friday"
             schedules["weekday"] = weekday_schedule
 
-        if weekend_metrics:
+        if len(weekend_metrics):
             weekend_schedule = self.generate_schedule(weekend_metrics, min_pods, max_pods)
             weekend_schedule.name = "weekend-schedule"
             weekend_schedule.description = "Scaling schedule for Saturday-Sunday"
@@ -298,55 +438,56 @@ class ScheduleGenerator:
 
         return schedules
 
-    def _identify_peak_hours(self, hourly_averages: Dict[int, Dict[str, float]]) -> List[Dict[str, Any]]:
+    def _identify_peak_hours(
+        self, hour_index: "np.ndarray", cpu: "np.ndarray", rps: "np.ndarray"
+    ) -> List[Dict[str, Any]]:
         """
-        Identify peak traffic hours from hourly averages.
+        Identify peak traffic hours from per-hour average columns.
 
         Args:
-            hourly_averages: Dictionary of hour -> metrics
+            hour_index: Occupied hour slots
+            cpu: Average CPU per occupied hour
+            rps: Average RPS per occupied hour
 
         Returns:
-            List of peak hour dictionaries
+            List of peak hour dictionaries, highest CPU first
         """
-        if not hourly_averages:
+        if hour_index.size == 0:
             return []
 
-        # Calculate overall average CPU and RPS
-        avg_cpu = sum(h["cpu"] for h in hourly_averages.values()) / len(hourly_averages)
-        avg_rps = sum(h["rps"] for h in hourly_averages.values()) / len(hourly_averages)
-
-        # Identify hours significantly above average (>50% higher)
-        peak_hours = []
-        for hour, metrics in hourly_averages.items():
-            if metrics["cpu"] > avg_cpu * 1.5 or metrics["rps"] > avg_rps * 1.5:
-                peak_hours.append({"hour": hour, "cpu": metrics["cpu"], "rps": metrics["rps"], "severity": "high"})
+        # Hours significantly above average (>50% higher), as one mask pass
+        peak_mask = (cpu > cpu.mean() * 1.5) | (rps > rps.mean() * 1.5)
+        peaks = np.nonzero(peak_mask)[0]
+        order = peaks[np.argsort(-cpu[peaks])]
 
-        return sorted(peak_hours, key=lambda x: x["cpu"], reverse=True)
+        return [
+            {"hour": int(hour_index[i]), "cpu": float(cpu[i]), "rps": float(rps[i]), "severity": "high"}
+            for i in order
+        ]
 
-    def _identify_low_hours(self, hourly_averages: Dict[int, Dict[str, float]]) -> List[Dict[str, Any]]:
+    def _identify_low_hours(
+        self, hour_index: "np.ndarray", cpu: "np.ndarray", rps: "np.ndarray"
+    ) -> List[Dict[str, Any]]:
         """
-        Identify low traffic hours from hourly averages.
+        Identify low traffic hours from per-hour average columns.
 
         Args:
-            hourly_averages: Dictionary of hour -> metrics
+            hour_index: Occupied hour slots
+            cpu: Average CPU per occupied hour
+            rps: Average RPS per occupied hour
 
         Returns:
-            List of low traffic hour dictionaries
+            List of low traffic hour dictionaries in hour order
         """
-        if not hourly_averages:
+        if hour_index.size == 0:
             return []
 
-        # Calculate overall average
-        avg_cpu = sum(h["cpu"] for h in hourly_averages.values()) / len(hourly_averages)
-        avg_rps = sum(h["rps"] for h in hourly_averages.values()) / len(hourly_averages)
-
-        # Identify hours significantly below average (<50% of average)
-        low_hours = []
-        for hour, metrics in hourly_averages.items():
-            if metrics["cpu"] < avg_cpu * 0.5 and metrics["rps"] < avg_rps * 0.5:
-                low_hours.append({"hour": hour, "cpu": metrics["cpu"], "rps": metrics["rps"]})
+        # Hours significantly below average (<50% of average); nonzero walks
+        # in ascending order, so the result is already hour-sorted
+        low_mask = (cpu < cpu.mean() * 0.5) & (rps < rps.mean() * 0.5)
+        lows = np.nonzero(low_mask)[0]
 
-        return sorted(low_hours, key=lambda x: x["hour"])
+        return [{"hour": int(hour_index[i]), "cpu": float(cpu[i]), "rps": float(rps[i])} for i in lows]
 
 
 def main():
@@ -9,23 +9,67 @@ This example demonstrates:
 - Audit logging
 """
 
+import asyncio
+import functools
 import os
 import re
+import threading
 import time
 import hashlib
 import json
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import deque
+
+import numpy as np
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter, BatchSpanProcessor
 
+# Audit events are serialized straight to bytes; orjson's native encoder
+# is ~5-10x faster on small dicts, with compact stdlib output as fallback
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize to JSON bytes with orjson's native encoder."""
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        """Serialize to compact JSON bytes with the stdlib fallback."""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Hyperscan compiles all PII patterns into one SIMD-scanned multi-pattern
+# DFA; the fused re alternation remains the fallback when it is absent
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 # Configure OpenTelemetry
 tracer_provider = TracerProvider()
 tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
 trace.set_tracer_provider(tracer_provider)
 tracer = trace.get_tracer(__name__)
 
+# Malicious-input markers fused into one compiled pattern: one scan of the
+# text instead of a sequential re.search per marker
+_DANGEROUS = re.compile(r'<script>|javascript:|onerror=|onclick=', re.IGNORECASE)
+
+# The markers are literal substrings, so an Aho-Corasick automaton checks
+# all of them in one linear scan with the case folded once; the fused
+# regex above stays as the stdlib fallback
+try:
+    import ahocorasick
+
+    _DANGER_AUTOMATON = ahocorasick.Automaton()
+    for _word in ('<script>', 'javascript:', 'onerror=', 'onclick='):
+        _DANGER_AUTOMATON.add_word(_word, _word)
+    _DANGER_AUTOMATON.make_automaton()
+except ImportError:
+    _DANGER_AUTOMATON = None
+
 
 class PIIDetector:
     """Detect and mask personally identifiable information."""
@@ -39,51 +83,127 @@ class PIIDetector:
         'ip_address': r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
     }
 
-    @staticmethod
-    def detect_pii(text):
-        """Detect PII in text."""
-        detections = {}
-        for pii_type, pattern in PIIDetector.PATTERNS.items():
-            matches = re.findall(pattern, text)
-            if matches:
-                detections[pii_type] = matches
-        return detections
-
-    @staticmethod
-    def mask_pii(text):
-        """Mask PII in text."""
-        masked_text = text
-
-        # Mask emails
-        masked_text = re.sub(
-            PIIDetector.PATTERNS['email'],
-            '[EMAIL_REDACTED]',
-            masked_text
-        )
+    # All patterns fused into one alternation compiled at class load: a
+    # single scan of the text covers every PII type instead of one full
+    # regex pass per pattern
+    _COMBINED = re.compile('|'.join(f'(?P<{k}>{p})' for k, p in PATTERNS.items()))
+
+    # IP addresses are detected but intentionally not masked, matching the
+    # per-pattern substitutions this replaces
+    _MASK_LABELS = {
+        'email': '[EMAIL_REDACTED]',
+        'phone': '[PHONE_REDACTED]',
+        'ssn': '[SSN_REDACTED]',
+        'credit_card': '[CARD_REDACTED]',
+    }
 
-        # Mask phone numbers
-        masked_text = re.sub(
-            PIIDetector.PATTERNS['phone'],
-            '[PHONE_REDACTED]',
-            masked_text
-        )
+    # Pattern id -> PII type, matching compile order of the Hyperscan database
+    _TYPE_BY_ID = tuple(PATTERNS)
 
-        # Mask SSN
-        masked_text = re.sub(
-            PIIDetector.PATTERNS['ssn'],
-            '[SSN_REDACTED]',
-            masked_text
-        )
+    def __init__(self):
+        self._db = None
+        self._scratch = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[p.encode() for p in self.PATTERNS.values()],
+                    ids=list(range(len(self.PATTERNS))),
+                    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(self.PATTERNS),
+                )
+                self._db = db
+                self._scratch = hyperscan.Scratch(db)
+            except Exception:
+                self._db = None
+                self._scratch = None
+
+    def _hyperscan_spans(self, data):
+        """Run one DFA scan over encoded text, returning non-overlapping byte spans."""
+        raw = []
+
+        def on_match(pattern_id, start, end, flags, context=None):
+            raw.append((start, end, pattern_id))
+
+        self._db.scan(data, match_event_handler=on_match, scratch=self._scratch)
+
+        # Hyperscan reports every match; keep the leftmost-longest,
+        # non-overlapping subset so spans splice cleanly
+        spans = []
+        last_end = 0
+        for start, end, pattern_id in sorted(raw, key=lambda m: (m[0], -m[1])):
+            if start < last_end:
+                continue
+            spans.append((start, end, self._TYPE_BY_ID[pattern_id]))
+            last_end = end
+        return spans
+
+    def detect_with_spans(self, text):
+        """Detect PII, returning both detections and the match spans.
+
+        Spans are (start, end, pii_type) offsets into the scanned text
+        (byte offsets on the Hyperscan path, character offsets otherwise);
+        hand them to mask_with_spans to mask without a second scan.
+        """
+        detections = {}
+        spans = []
+        if self._db is not None:
+            data = text.encode()
+            spans = self._hyperscan_spans(data)
+            for start, end, pii_type in spans:
+                detections.setdefault(pii_type, []).append(data[start:end].decode())
+            return detections, spans
+
+        for match in self._COMBINED.finditer(text):
+            detections.setdefault(match.lastgroup, []).append(match.group())
+            spans.append((match.start(), match.end(), match.lastgroup))
+        return detections, spans
+
+    def detect_pii(self, text):
+        """Detect PII in text."""
+        return self.detect_with_spans(text)[0]
+
+    def mask_with_spans(self, text, spans):
+        """Mask PII by splicing replacements between known spans."""
+        if not spans:
+            return text
+
+        if self._db is not None:
+            # Spans index the encoded bytes; splice there and decode once
+            data = text.encode()
+            parts = []
+            cursor = 0
+            for start, end, pii_type in spans:
+                label = self._MASK_LABELS.get(pii_type)
+                if label is None:
+                    continue
+                parts.append(data[cursor:start])
+                parts.append(label.encode())
+                cursor = end
+            parts.append(data[cursor:])
+            return b''.join(parts).decode()
+
+        parts = []
+        cursor = 0
+        for start, end, pii_type in spans:
+            label = self._MASK_LABELS.get(pii_type)
+            if label is None:
+                continue
+            parts.append(text[cursor:start])
+            parts.append(label)
+            cursor = end
+        parts.append(text[cursor:])
+        return ''.join(parts)
+
+    def mask_pii(self, text):
+        """Mask PII in text."""
+        if self._db is not None:
+            return self.mask_with_spans(text, self._hyperscan_spans(text.encode()))
 
-        # Mask credit cards
-        masked_text = re.sub(
-            PIIDetector.PATTERNS['credit_card'],
-            '[CARD_REDACTED]',
-            masked_text
+        return self._COMBINED.sub(
+            lambda m: self._MASK_LABELS.get(m.lastgroup, m.group()),
+            text
         )
 
-        return masked_text
-
 
 class RateLimiter:
     """Token bucket rate limiter."""
@@ -91,52 +211,124 @@ class RateLimiter:
     def __init__(self, requests_per_minute=60, burst=10):
         self.requests_per_minute = requests_per_minute
         self.burst = burst
-        self.buckets = defaultdict(lambda: {
-            'tokens': burst,
-            'last_update': time.time()
-        })
-
-    def _refill_bucket(self, bucket):
-        """Refill tokens based on time elapsed."""
-        now = time.time()
-        elapsed = now - bucket['last_update']
-        tokens_to_add = elapsed * (self.requests_per_minute / 60.0)
-
-        bucket['tokens'] = min(
-            self.burst,
-            bucket['tokens'] + tokens_to_add
-        )
-        bucket['last_update'] = now
+        self.refill_rate = requests_per_minute / 60.0
+        # SoA bucket table: tokens and last-update times live in parallel
+        # arrays indexed by a compact interned id, instead of one dict
+        # allocated per identifier
+        self._id_map = {}
+        self._tokens = np.empty(1024, dtype=np.float32)
+        self._last = np.empty(1024, dtype=np.float64)
+
+    def _intern(self, identifier):
+        """Map an identifier to its bucket slot, growing the table 2x as needed."""
+        idx = self._id_map.get(identifier)
+        if idx is None:
+            idx = len(self._id_map)
+            if idx == len(self._tokens):
+                self._tokens = np.concatenate([self._tokens, np.empty_like(self._tokens)])
+                self._last = np.concatenate([self._last, np.empty_like(self._last)])
+            self._id_map[identifier] = idx
+            self._tokens[idx] = self.burst
+            self._last[idx] = time.time()
+        return idx
 
     def is_allowed(self, identifier):
         """Check if request is allowed."""
-        bucket = self.buckets[identifier]
-        self._refill_bucket(bucket)
+        idx = self._intern(identifier)
+        now = time.time()
+        tokens = min(self.burst, self._tokens[idx] + (now - self._last[idx]) * self.refill_rate)
+        self._last[idx] = now
 
-        if bucket['tokens'] >= 1:
-            bucket['tokens'] -= 1
-            return True, bucket['tokens']
+        if tokens >= 1:
+            self._tokens[idx] = tokens - 1
+            return True, float(tokens - 1)
 
+        self._tokens[idx] = tokens
         return False, 0
 
+    def is_allowed_batch(self, identifiers):
+        """Vectorized allow-check over many distinct identifiers at once."""
+        idxs = np.fromiter(
+            (self._intern(i) for i in identifiers),
+            dtype=np.int64,
+            count=len(identifiers)
+        )
+        now = time.time()
+        tokens = np.minimum(self.burst, self._tokens[idxs] + (now - self._last[idxs]) * self.refill_rate)
+        allowed = tokens >= 1
+        self._tokens[idxs] = tokens - allowed
+        self._last[idxs] = now
+        return allowed
+
 
 class AuditLogger:
     """Audit logger for security events."""
 
+    # Drain at most this many lines per disk write
+    BATCH_SIZE = 256
+    # How long the drain thread sleeps between flushes
+    FLUSH_INTERVAL = 0.1
+
     def __init__(self, log_file='audit.log'):
         self.log_file = log_file
+        # One long-lived binary append handle instead of open/write/close
+        # syscalls per event; queued bytes are coalesced by a background
+        # thread with no encode step at write time
+        self._fh = open(log_file, 'ab', buffering=1 << 16)
+        self._queue = deque()
+        self._closed = False
+        # Second-resolution timestamp prefix cache: event bursts within the
+        # same second skip the datetime allocation and strftime call
+        self._last_sec = 0
+        self._last_str = ''
+        self._drainer = threading.Thread(target=self._drain, daemon=True)
+        self._drainer.start()
+
+    def _timestamp(self):
+        """Build an ISO timestamp, reusing the cached prefix within a second."""
+        now = time.time()
+        sec = int(now)
+        if sec != self._last_sec:
+            self._last_str = datetime.utcfromtimestamp(sec).strftime('%Y-%m-%dT%H:%M:%S')
+            self._last_sec = sec
+        return f"{self._last_str}.{int((now - sec) * 1e6):06d}Z"
 
     def log_event(self, event_type, user_id, details):
         """Log security event."""
         event = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': self._timestamp(),
             'event_type': event_type,
             'user_id': user_id,
             'details': details
         }
 
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(event) + '\n')
+        self._queue.append(_dumps(event) + b'\n')
+
+    def _drain(self):
+        """Flush queued events to disk in coalesced batches."""
+        while not self._closed:
+            time.sleep(self.FLUSH_INTERVAL)
+            self._flush_batch()
+
+    def _flush_batch(self):
+        """Write up to BATCH_SIZE queued lines with a single write call."""
+        queue = self._queue
+        batch = []
+        while queue and len(batch) < self.BATCH_SIZE:
+            batch.append(queue.popleft())
+        if batch:
+            self._fh.write(b''.join(batch))
+            self._fh.flush()
+
+    def close(self):
+        """Stop the drain thread and flush any remaining events."""
+        if self._closed:
+            return
+        self._closed = True
+        self._drainer.join(timeout=1.0)
+        while self._queue:
+            self._flush_batch()
+        self._fh.close()
 
 
 class SecureAIService:
@@ -147,12 +339,17 @@ class SecureAIService:
         self.pii_detector = PIIDetector()
         self.audit_logger = AuditLogger()
         self.api_keys = self._load_api_keys()
+        # Hot keys bypass the SHA round entirely after first use: the
+        # per-instance LRU caches the lookup keyed on the raw key string
+        self._validate_api_key = functools.lru_cache(maxsize=1024)(self._validate_api_key)
 
     def _load_api_keys(self):
         """Load API keys from secure storage."""
-        # In production, load from secrets manager
+        # In production, load from secrets manager. Keys are stored as raw
+        # 32-byte digests: half the memory of hexdigest strings and no hex
+        # encoding on lookup.
         return {
-            hashlib.sha256(b'test-api-key-1').hexdigest(): {
+            hashlib.sha256(b'test-api-key-1').digest(): {
                 'user_id': 'user-1',
                 'tier': 'premium',
                 'permissions': ['inference', 'streaming']
@@ -161,8 +358,7 @@ class SecureAIService:
 
     def _validate_api_key(self, api_key):
         """Validate API key."""
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-        return self.api_keys.get(key_hash)
+        return self.api_keys.get(hashlib.sha256(api_key.encode()).digest())
 
     def _validate_input(self, text, max_length=5000):
         """Validate user input."""
@@ -173,106 +369,110 @@ class SecureAIService:
             raise ValueError(f"Input too long: maximum {max_length} characters")
 
         # Check for malicious patterns
-        dangerous_patterns = [
-            r'<script>',
-            r'javascript:',
-            r'onerror=',
-            r'onclick=',
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        if _DANGER_AUTOMATON is not None:
+            for _ in _DANGER_AUTOMATON.iter(text.lower()):
                 raise ValueError("Potentially malicious input detected")
+        elif _DANGEROUS.search(text):
+            raise ValueError("Potentially malicious input detected")
 
         return True
 
-    @tracer.start_as_current_span("secure_inference")
-    def secure_inference(self, api_key, user_input, model='gpt-4'):
+    async def secure_inference(self, api_key, user_input, model='gpt-4'):
         """Perform inference with security controls."""
-        span = trace.get_current_span()
-
-        # 1. API Key Authentication
-        user_info = self._validate_api_key(api_key)
-        if not user_info:
-            span.set_attribute("security.auth_failed", True)
-            self.audit_logger.log_event(
-                'AUTH_FAILED',
-                'unknown',
-                {'reason': 'Invalid API key'}
-            )
-            raise PermissionError("Invalid API key")
-
-        user_id = user_info['user_id']
-        span.set_attribute("user.id", user_id)
-        span.set_attribute("user.tier", user_info['tier'])
-
-        # 2. Rate Limiting
-        allowed, remaining = self.rate_limiter.is_allowed(user_id)
-        span.set_attribute("rate_limit.allowed", allowed)
-        span.set_attribute("rate_limit.remaining", remaining)
-
-        if not allowed:
+        # Explicit context manager rather than decorator so the span stays
+        # open across the awaits
+        with tracer.start_as_current_span("secure_inference") as span:
+            # Accumulate attributes and hand them to the span in one batched
+            # set_attributes call instead of one API round-trip per field
+            attrs = {}
+
+            # 1. API Key Authentication
+            user_info = self._validate_api_key(api_key)
+            if not user_info:
+                span.set_attributes({'security.auth_failed': True})
+                self.audit_logger.log_event(
+                    'AUTH_FAILED',
+                    'unknown',
+                    {'reason': 'Invalid API key'}
+                )
+                raise PermissionError("Invalid API key")
+
+            user_id = user_info['user_id']
+            attrs['user.id'] = user_id
+            attrs['user.tier'] = user_info['tier']
+
+            # 2. Rate Limiting
+            allowed, remaining = self.rate_limiter.is_allowed(user_id)
+            attrs['rate_limit.allowed'] = allowed
+            attrs['rate_limit.remaining'] = remaining
+
+            if not allowed:
+                span.set_attributes(attrs)
+                self.audit_logger.log_event(
+                    'RATE_LIMIT_EXCEEDED',
+                    user_id,
+                    {'endpoint': 'inference'}
+                )
+                raise PermissionError("Rate limit exceeded")
+
+            # 3. Input Validation
+            try:
+                self._validate_input(user_input)
+            except ValueError as e:
+                attrs['validation.failed'] = True
+                span.set_attributes(attrs)
+                self.audit_logger.log_event(
+                    'VALIDATION_FAILED',
+                    user_id,
+                    {'reason': str(e)}
+                )
+                raise
+
+            # 4. PII Detection (one scan; the spans are reused for masking)
+            pii_detected, pii_spans = self.pii_detector.detect_with_spans(user_input)
+            if pii_detected:
+                attrs['pii.detected'] = True
+                attrs['pii.types'] = list(pii_detected.keys())
+
+                self.audit_logger.log_event(
+                    'PII_DETECTED',
+                    user_id,
+                    {
+                        'pii_types': list(pii_detected.keys()),
+                        'pii_count': sum(len(v) for v in pii_detected.values())
+                    }
+                )
+
+                # Mask PII in logs and traces, reusing the detection spans
+                masked_input = self.pii_detector.mask_with_spans(user_input, pii_spans)
+                attrs['input.masked'] = masked_input[:100]
+            else:
+                attrs['pii.detected'] = False
+                attrs['input.text'] = user_input[:100]
+
+            span.set_attributes(attrs)
+
+            # 5. Perform Inference
+            result = await self._perform_inference(user_input, model)
+
+            # 6. Audit Logging
             self.audit_logger.log_event(
-                'RATE_LIMIT_EXCEEDED',
-                user_id,
-                {'endpoint': 'inference'}
-            )
-            raise PermissionError("Rate limit exceeded")
-
-        # 3. Input Validation
-        try:
-            self._validate_input(user_input)
-        except ValueError as e:
-            span.set_attribute("validation.failed", True)
-            self.audit_logger.log_event(
-                'VALIDATION_FAILED',
-                user_id,
-                {'reason': str(e)}
-            )
-            raise
-
-        # 4. PII Detection
-        pii_detected = self.pii_detector.detect_pii(user_input)
-        if pii_detected:
-            span.set_attribute("pii.detected", True)
-            span.set_attribute("pii.types", list(pii_detected.keys()))
-
-            self.audit_logger.log_event(
-                'PII_DETECTED',
+                'INFERENCE_SUCCESS',
                 user_id,
                 {
-                    'pii_types': list(pii_detected.keys()),
-                    'pii_count': sum(len(v) for v in pii_detected.values())
+                    'model': model,
+                    'input_length': len(user_input),
+                    'pii_detected': len(pii_detected) > 0,
+                    'tokens_used': result['tokens']
                 }
             )
 
-            # Mask PII in logs and traces
-            masked_input = self.pii_detector.mask_pii(user_input)
-            span.set_attribute("input.masked", masked_input[:100])
-        else:
-            span.set_attribute("pii.detected", False)
-            span.set_attribute("input.text", user_input[:100])
-
-        # 5. Perform Inference
-        result = self._perform_inference(user_input, model)
-
-        # 6. Audit Logging
-        self.audit_logger.log_event(
-            'INFERENCE_SUCCESS',
-            user_id,
-            {
-                'model': model,
-                'input_length': len(user_input),
-                'pii_detected': len(pii_detected) > 0,
-                'tokens_used': result['tokens']
-            }
-        )
-
-        return result
+            return result
 
-    def _perform_inference(self, user_input, model):
+    async def _perform_inference(self, user_input, model):
         """Perform actual AI inference (mock)."""
-        time.sleep(0.2)
+        # Non-blocking sleep: concurrent requests overlap on one thread
+        await asyncio.sleep(0.2)
 
         return {
             'result': f"Secure response to: {user_input[:30]}...",
@@ -282,7 +482,7 @@ class SecureAIService:
         }
 
 
-if __name__ == "__main__":
+async def _demo():
     print("Secure AI Service Example")
     print("=" * 50)
 
@@ -291,7 +491,7 @@ if __name__ == "__main__":
     # Test 1: Valid request
     print("\n=== Test 1: Valid Request ===")
     try:
-        result = service.secure_inference(
+        result = await service.secure_inference(
             'test-api-key-1',
             'What is machine learning?',
             'gpt-4'
@@ -303,7 +503,7 @@ if __name__ == "__main__":
     # Test 2: Request with PII
     print("\n=== Test 2: Request with PII ===")
     try:
-        result = service.secure_inference(
+        result = await service.secure_inference(
             'test-api-key-1',
             'My email is john@example.com and phone is 555-123-4567',
             'gpt-4'
@@ -316,7 +516,7 @@ if __name__ == "__main__":
     # Test 3: Invalid API key
     print("\n=== Test 3: Invalid API Key ===")
     try:
-        result = service.secure_inference(
+        await service.secure_inference(
             'invalid-key',
             'Test query',
             'gpt-4'
@@ -324,20 +524,27 @@ if __name__ == "__main__":
     except PermissionError as e:
         print(f"Expected error: {e}")
 
-    # Test 4: Rate limiting
+    # Test 4: Rate limiting. The 22 requests (exceeding the burst limit of
+    # 20) run concurrently, overlapping their mock inference sleeps instead
+    # of serializing >4 s of wall time.
     print("\n=== Test 4: Rate Limiting ===")
-    for i in range(22):  # Exceed burst limit of 20
-        try:
-            result = service.secure_inference(
-                'test-api-key-1',
-                f'Query {i}',
-                'gpt-4'
-            )
-            print(f"Request {i}: Success")
-        except PermissionError as e:
+    results = await asyncio.gather(
+        *(service.secure_inference('test-api-key-1', f'Query {i}', 'gpt-4') for i in range(22)),
+        return_exceptions=True
+    )
+    for i, result in enumerate(results):
+        if isinstance(result, PermissionError):
             print(f"Request {i}: Rate limited")
-            break
+        elif isinstance(result, Exception):
+            print(f"Request {i}: Error: {result}")
+        else:
+            print(f"Request {i}: Success")
 
+    service.audit_logger.close()  # Flush any queued audit events
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
     time.sleep(2)  # Allow spans to export
     print("\n" + "=" * 50)
     print("Security example completed")
@@ -6,51 +6,265 @@ Each tool provides specific functionality for AI agents to investigate
 incidents, search logs, query traces, and analyze metrics.
 """
 
+import asyncio
+import functools
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 from dataclasses import dataclass
 
+try:
+    import orjson
+
+    _ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_response(obj: Any) -> bytes:
+        """Encode a tool response to JSON bytes (orjson fast path).
+
+        orjson serializes datetimes and numpy values natively at C speed,
+        so responses need no isoformat pre-conversion.
+        """
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+
+except ImportError:
+
+    def dumps_response(obj: Any) -> bytes:
+        """Encode a tool response to JSON bytes (stdlib fallback)."""
+        return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _StructuredAdapter(logging.LoggerAdapter):
+    """Adapter that merges per-call extra fields with the bound ones.
+
+    The stdlib adapter replaces kwargs["extra"] outright on this Python
+    version, which would drop the per-call fields.
+    """
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+
+# One structured "tool_invoked" record per call, with the parameters as
+# record attributes a JSON formatter can index directly — no message
+# formatting on the hot path and no regex parsing downstream
+_LOG = _StructuredAdapter(logger, {"component": "mcp-tools"})
+
+# Shared pool for fanning out independent data-store queries; these are
+# I/O-bound round trips, so overlapping them cuts wall-clock latency to
+# the slowest leg
+_TELEMETRY_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Supported relative time ranges, built once at import; from_string runs on
+# every tool invocation
+_RANGE_MAP = {
+    "last_5m": timedelta(minutes=5),
+    "last_15m": timedelta(minutes=15),
+    "last_30m": timedelta(minutes=30),
+    "last_hour": timedelta(hours=1),
+    "last_3h": timedelta(hours=3),
+    "last_6h": timedelta(hours=6),
+    "last_12h": timedelta(hours=12),
+    "last_24h": timedelta(hours=24),
+    "last_7d": timedelta(days=7),
+    "last_30d": timedelta(days=30),
+}
+
+# Pre-resolved to float seconds so from_string is pure epoch arithmetic
+_RANGE_SECONDS = {name: delta.total_seconds() for name, delta in _RANGE_MAP.items()}
+
+_DEFAULT_SECONDS = 3600.0
+
+# Shared default for CorrelateEventsTool; frozenset gives O(1) membership
+# tests downstream and a stable, hashable cache key
+_DEFAULT_TYPES = frozenset({"traces", "logs", "metrics", "events"})
+
+# Interned severity filter for incident log queries; a tuple is hashable
+# for downstream caches and never reallocated per call
+_ERROR_SEVERITIES = ("error", "critical")
+
+class Aggregation(IntEnum):
+    """Metric aggregation kinds, resolved once at the tool boundary.
+
+    Integer-valued so the data store can index a function table per
+    metric group instead of string-comparing the aggregation name for
+    every datapoint batch.
+    """
+
+    AVG = 0
+    SUM = 1
+    MIN = 2
+    MAX = 3
+    P50 = 4
+    P95 = 5
+    P99 = 6
+
+
+_AGG_TABLE = {
+    "avg": Aggregation.AVG,
+    "sum": Aggregation.SUM,
+    "min": Aggregation.MIN,
+    "max": Aggregation.MAX,
+    "p50": Aggregation.P50,
+    "p95": Aggregation.P95,
+    "p99": Aggregation.P99,
+}
+
+# Shared error response for correlation requests without any ID; built
+# once and kept a plain dict so it serializes like every other response.
+# Treat as read-only
+_ERR_NO_ID = {
+    "status": "error",
+    "error": "At least one of correlation_id, trace_id, or request_id is required",
+}
+
+_ID_KEYS = ("correlation_id", "trace_id", "request_id")
+
+# Shared immutable placeholder for telemetry kinds a gather never queries
+_EMPTY: tuple = ()
+
+
+# Explicit __slots__ drops the per-instance __dict__ (a TimeRange is
+# built per tool call) and frozen makes instances hashable for use as
+# cache keys; dataclass(slots=True) would need Python 3.10 and the repo
+# supports 3.8+
+@dataclass(frozen=True)
 class TimeRange:
-    """Represents a time range for queries."""
-    start: datetime
-    end: datetime
-    
+    """Represents a time range for queries as UTC epoch seconds.
+
+    time.time() is a single clock read, whereas datetime.utcnow()
+    (deprecated) constructs a full datetime object per call; tools create
+    a TimeRange on every invocation. Use start_dt/end_dt where a datetime
+    is genuinely required.
+    """
+
+    __slots__ = ("start", "end")
+
+    start: float
+    end: float
+
     @classmethod
     def from_string(cls, range_str: str) -> "TimeRange":
         """
         Parse time range from string.
-        
+
         Supported formats:
         - "last_5m", "last_15m", "last_hour", "last_24h", "last_7d"
         - ISO 8601 datetime ranges
+
+        Unknown strings default to the last hour.
         """
-        now = datetime.utcnow()
-        
-        range_map = {
-            "last_5m": timedelta(minutes=5),
-            "last_15m": timedelta(minutes=15),
-            "last_30m": timedelta(minutes=30),
-            "last_hour": timedelta(hours=1),
-            "last_3h": timedelta(hours=3),
-            "last_6h": timedelta(hours=6),
-            "last_12h": timedelta(hours=12),
-            "last_24h": timedelta(hours=24),
-            "last_7d": timedelta(days=7),
-            "last_30d": timedelta(days=30),
-        }
-        
-        if range_str in range_map:
-            delta = range_map[range_str]
-            return cls(start=now - delta, end=now)
-        
-        # Default to last hour if unknown
-        return cls(start=now - timedelta(hours=1), end=now)
+        now = time.time()
+        return cls(start=now - _RANGE_SECONDS.get(range_str, _DEFAULT_SECONDS), end=now)
+
+    @property
+    def start_dt(self) -> datetime:
+        """Range start as a naive UTC datetime."""
+        return datetime.utcfromtimestamp(self.start)
+
+    @property
+    def end_dt(self) -> datetime:
+        """Range end as a naive UTC datetime."""
+        return datetime.utcfromtimestamp(self.end)
+
+
+
+def _time_filter(time_window: TimeRange) -> Dict[str, float]:
+    """Canonical time-range filter shape shared by every tool.
+
+    Data-store contract: queries must always carry BOTH bounds — even
+    when an exact ID (trace_id, correlation_id) is supplied — so the
+    backing store can prune partitions on its timestamp index instead of
+    scanning the full table for the ID.
+    """
+    return {"start": time_window.start, "end": time_window.end}
+
+
+
+
+class QueryResult(NamedTuple):
+    """Streaming result contract for data stores.
+
+    Stores that support it return the row count up front plus a lazy row
+    iterator, so large log/trace responses are encoded chunk by chunk at
+    the transport instead of being materialized as one Python list.
+    Legacy stores may keep returning plain lists; tools accept both.
+    """
+
+    count: int
+    iter_rows: Iterable[Dict[str, Any]]
+
+
+def _result_parts(result) -> tuple:
+    """Split a store result into (count, rows) for either contract."""
+    if isinstance(result, QueryResult):
+        return result.count, result.iter_rows
+    return len(result), result
+
+
+def _freeze_filters(value: Any) -> Any:
+    """Recursively convert a filter tree into a hashable canonical form.
+
+    Dicts become sorted (key, value) tuples and sequences become tuples,
+    so equal filters always freeze to the same key. Passed to the data
+    store as filter_key so its caches hash one tuple instead of
+    re-canonicalizing the dict tree per lookup.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return tuple(sorted((k, _freeze_filters(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze_filters(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_log_filter(
+    start: int, end: int, service_name: Optional[str], severity: Optional[str]
+) -> "MappingProxyType":
+    """Memoized log-filter builder keyed on whole-second time buckets.
+
+    Dashboards repeat identical queries within the same second, so the
+    bucketed key lets them share one frozen dict. Returned mappings are
+    cached — treat them (including the nested time_range) as read-only.
+    """
+    optional = {"service_name": service_name, "severity": severity}
+    return MappingProxyType({
+        "time_range": {"start": start, "end": end},
+        **{k: v for k, v in optional.items() if v is not None},
+    })
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_trace_filter(
+    start: int,
+    end: int,
+    trace_id: Optional[str],
+    service_name: Optional[str],
+    operation: Optional[str],
+    min_duration_ms: Optional[int],
+    has_error: Optional[bool],
+) -> "MappingProxyType":
+    """Memoized trace-filter builder; same caching contract as logs."""
+    optional = {
+        "trace_id": trace_id,
+        "service_name": service_name,
+        "operation": operation,
+        "min_duration_ms": min_duration_ms,
+        "has_error": has_error,
+    }
+    return MappingProxyType({
+        "time_range": {"start": start, "end": end},
+        **{k: v for k, v in optional.items() if v is not None},
+    })
 
 
 class SearchLogsTool:
@@ -94,37 +308,41 @@ class SearchLogsTool:
         """
         time_window = TimeRange.from_string(time_range)
         
-        logger.info(
-            f"Searching logs: query='{query}', service={service_name}, "
-            f"time_range={time_range}, severity={severity}"
+        _LOG.info(
+            "tool_invoked",
+            extra={
+                "tool": "search_logs",
+                "query": query,
+                "service": service_name,
+                "time_range": time_range,
+                "severity": severity,
+            },
         )
         
-        # Build query filters
-        filters = {
-            "time_range": {"start": time_window.start, "end": time_window.end},
-        }
-        
-        if service_name:
-            filters["service_name"] = service_name
-        if severity:
-            filters["severity"] = severity
+        # Memoized frozen filter; repeats within the same second share it
+        filters = _build_log_filter(
+            int(time_window.start), int(time_window.end), service_name, severity
+        )
         
         # Execute search
-        results = self.data_store.search_logs(
-            query=query,
-            filters=filters,
-            limit=limit,
-            use_semantic=use_semantic,
+        count, rows = _result_parts(
+            self.data_store.search_logs(
+                query=query,
+                filters=filters,
+                limit=limit,
+                use_semantic=use_semantic,
+                filter_key=_freeze_filters(filters),
+            )
         )
         
         return {
             "status": "success",
-            "results": results,
+            "results": rows,
             "metadata": {
-                "count": len(results),
+                "count": count,
                 "query": query,
                 "time_range": time_range,
-                "filters": filters,
+                "filters": dict(filters),
             },
         }
 
@@ -173,37 +391,43 @@ class QueryTracesTool:
         """
         time_window = TimeRange.from_string(time_range)
         
-        logger.info(
-            f"Querying traces: trace_id={trace_id}, service={service_name}, "
-            f"operation={operation}, time_range={time_range}"
+        _LOG.info(
+            "tool_invoked",
+            extra={
+                "tool": "query_traces",
+                "trace_id": trace_id,
+                "service": service_name,
+                "operation": operation,
+                "time_range": time_range,
+            },
         )
         
-        # Build query filters
-        filters = {
-            "time_range": {"start": time_window.start, "end": time_window.end},
-        }
-        
-        if trace_id:
-            filters["trace_id"] = trace_id
-        if service_name:
-            filters["service_name"] = service_name
-        if operation:
-            filters["operation"] = operation
-        if min_duration_ms:
-            filters["min_duration_ms"] = min_duration_ms
-        if has_error is not None:
-            filters["has_error"] = has_error
+        # Memoized frozen filter; has_error=False is a valid filter value
+        # and is kept by the builder's is-not-None guard
+        filters = _build_trace_filter(
+            int(time_window.start),
+            int(time_window.end),
+            trace_id,
+            service_name,
+            operation,
+            min_duration_ms,
+            has_error,
+        )
         
         # Execute query
-        results = self.data_store.query_traces(filters=filters, limit=limit)
+        count, rows = _result_parts(
+            self.data_store.query_traces(
+                filters=filters, limit=limit, filter_key=_freeze_filters(filters)
+            )
+        )
         
         return {
             "status": "success",
-            "results": results,
+            "results": rows,
             "metadata": {
-                "count": len(results),
+                "count": count,
                 "time_range": time_range,
-                "filters": filters,
+                "filters": dict(filters),
             },
         }
 
@@ -215,15 +439,22 @@ class GetMetricsTool:
     Supports various aggregations and grouping dimensions.
     """
     
+    # Dashboards re-issue identical queries every few seconds; a short
+    # TTL turns those repeats into dict lookups instead of store round
+    # trips while staying fresher than a typical refresh interval
+    CACHE_TTL = 10.0
+    CACHE_MAX = 1024
+
     def __init__(self, data_store):
         """
         Initialize the get metrics tool.
-        
+
         Args:
             data_store: Data store instance for querying metrics
         """
         self.data_store = data_store
-    
+        self._cache: Dict[tuple, tuple] = {}
+
     def execute(
         self,
         metric_name: str,
@@ -234,34 +465,53 @@ class GetMetricsTool:
     ) -> Dict[str, Any]:
         """
         Get time-series metrics.
-        
+
         Args:
             metric_name: Name of the metric
             aggregation: Aggregation type (avg, sum, min, max, p50, p95, p99)
             time_range: Time range for metrics
             labels: Label filters (key-value pairs)
             group_by: Dimensions to group by
-            
+
         Returns:
             Dictionary with metric data and metadata
         """
+        # Keyed on the range string, not resolved timestamps, so
+        # consecutive refreshes hit the same slot until the TTL rolls
+        cache_key = (
+            metric_name,
+            aggregation,
+            time_range,
+            tuple(sorted((labels or {}).items())),
+            tuple(group_by or ()),
+        )
+        now = time.monotonic()
+        cached = self._cache.get(cache_key)
+        if cached is not None and now - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
         time_window = TimeRange.from_string(time_range)
-        
-        logger.info(
-            f"Getting metrics: metric={metric_name}, agg={aggregation}, "
-            f"time_range={time_range}"
+
+        _LOG.info(
+            "tool_invoked",
+            extra={
+                "tool": "get_metrics",
+                "metric": metric_name,
+                "aggregation": aggregation,
+                "time_range": time_range,
+            },
         )
-        
+
         # Execute query
         results = self.data_store.get_metrics(
             metric_name=metric_name,
-            aggregation=aggregation,
-            time_range={"start": time_window.start, "end": time_window.end},
+            aggregation=_AGG_TABLE.get(aggregation, Aggregation.AVG),
+            time_range=_time_filter(time_window),
             labels=labels or {},
             group_by=group_by or [],
         )
-        
-        return {
+
+        response = {
             "status": "success",
             "results": results,
             "metadata": {
@@ -273,6 +523,14 @@ class GetMetricsTool:
             },
         }
 
+        if len(self._cache) >= self.CACHE_MAX:
+            # Cheap wholesale eviction; entries expire within CACHE_TTL
+            # anyway, so precise LRU bookkeeping is not worth the cost
+            self._cache.clear()
+        self._cache[cache_key] = (now, response)
+
+        return response
+
 
 class CorrelateEventsTool:
     """
@@ -309,29 +567,27 @@ class CorrelateEventsTool:
         Returns:
             Dictionary with correlated telemetry
         """
-        if not correlation_id and not trace_id and not request_id:
-            return {
-                "status": "error",
-                "error": "At least one of correlation_id, trace_id, or request_id is required",
-            }
-        
-        logger.info(
-            f"Correlating events: correlation_id={correlation_id}, "
-            f"trace_id={trace_id}, request_id={request_id}"
+        ids = (correlation_id, trace_id, request_id)
+        if not any(ids):
+            # Short-circuit before any logging or allocation
+            return _ERR_NO_ID
+        
+        _LOG.info(
+            "tool_invoked",
+            extra={
+                "tool": "correlate_events",
+                "correlation_id": correlation_id,
+                "trace_id": trace_id,
+                "request_id": request_id,
+            },
         )
         
-        # Build query
-        query = {}
-        if correlation_id:
-            query["correlation_id"] = correlation_id
-        if trace_id:
-            query["trace_id"] = trace_id
-        if request_id:
-            query["request_id"] = request_id
+        # Build query in one dict display from the supplied IDs
+        query = {k: v for k, v in zip(_ID_KEYS, ids) if v}
         
-        # Set default types if not specified
-        if include_types is None:
-            include_types = ["traces", "logs", "metrics", "events"]
+        # Frozenset: O(1) membership checks downstream and a hashable,
+        # order-insensitive cache key
+        include_types = frozenset(include_types) if include_types else _DEFAULT_TYPES
         
         # Execute correlation
         results = self.data_store.correlate_events(
@@ -345,7 +601,7 @@ class CorrelateEventsTool:
                 "correlation_id": correlation_id,
                 "trace_id": trace_id,
                 "request_id": request_id,
-                "types_included": include_types,
+                "types_included": sorted(include_types),
             },
         }
 
@@ -391,9 +647,14 @@ class AnalyzeIncidentTool:
         """
         time_window = TimeRange.from_string(time_range)
         
-        logger.info(
-            f"Analyzing incident: incident_id={incident_id}, "
-            f"services={affected_services}, symptoms={symptoms}"
+        _LOG.info(
+            "tool_invoked",
+            extra={
+                "tool": "analyze_incident",
+                "incident_id": incident_id,
+                "services": affected_services,
+                "symptoms": symptoms,
+            },
         )
         
         # Gather relevant telemetry
@@ -421,46 +682,151 @@ class AnalyzeIncidentTool:
             },
         }
     
-    def _gather_telemetry(
+    async def execute_async(
         self,
+        incident_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        time_range: str = "last_hour",
+        affected_services: Optional[List[str]] = None,
+        symptoms: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of execute for event-loop-based MCP servers.
+
+        Awaits both telemetry queries concurrently on one thread; prefer
+        this from async handlers so the loop stays free while the data
+        store responds.
+        """
+        time_window = TimeRange.from_string(time_range)
+
+        _LOG.info(
+            "tool_invoked",
+            extra={
+                "tool": "analyze_incident",
+                "incident_id": incident_id,
+                "services": affected_services,
+                "symptoms": symptoms,
+            },
+        )
+
+        telemetry = await self._gather_telemetry_async(
+            correlation_id=correlation_id,
+            time_window=time_window,
+            services=affected_services or [],
+        )
+
+        analysis = self.analyzer.analyze(
+            telemetry=telemetry,
+            symptoms=symptoms or [],
+            services=affected_services or [],
+        )
+
+        return {
+            "status": "success",
+            "analysis": analysis,
+            "metadata": {
+                "incident_id": incident_id,
+                "time_range": time_range,
+                "affected_services": affected_services,
+                "telemetry_count": len(telemetry),
+            },
+        }
+
+    @staticmethod
+    def _telemetry_filters(
         correlation_id: Optional[str],
         time_window: TimeRange,
         services: List[str],
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Gather all relevant telemetry for analysis."""
-        telemetry = {
-            "traces": [],
-            "logs": [],
-            "metrics": [],
-            "events": [],
-        }
-        
-        # Gather traces
+    ) -> tuple:
+        """Build the trace and log filters shared by both gather paths."""
+        # Dedupe and sort so equivalent service lists produce identical
+        # filters (and identical downstream cache keys)
+        if services:
+            services = tuple(sorted(set(services)))
+
         trace_filters = {
-            "time_range": {"start": time_window.start, "end": time_window.end},
+            "time_range": _time_filter(time_window),
         }
         if correlation_id:
             trace_filters["correlation_id"] = correlation_id
         if services:
             trace_filters["service_name"] = services
-        
-        telemetry["traces"] = self.data_store.query_traces(
-            filters=trace_filters, limit=100
-        )
-        
-        # Gather logs
+
         log_filters = {
-            "time_range": {"start": time_window.start, "end": time_window.end},
-            "severity": ["error", "critical"],
+            "time_range": _time_filter(time_window),
+            "severity": _ERROR_SEVERITIES,
         }
         if services:
             log_filters["service_name"] = services
-        
-        telemetry["logs"] = self.data_store.search_logs(
-            query="*", filters=log_filters, limit=100
+
+        return trace_filters, log_filters
+
+    def _gather_telemetry(
+        self,
+        correlation_id: Optional[str],
+        time_window: TimeRange,
+        services: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Gather all relevant telemetry for analysis."""
+        trace_filters, log_filters = self._telemetry_filters(
+            correlation_id, time_window, services
         )
-        
-        return telemetry
+
+        # Dispatch both queries concurrently; they are independent round trips
+        f_traces = _TELEMETRY_POOL.submit(
+            self.data_store.query_traces, filters=trace_filters, limit=100
+        )
+        f_logs = _TELEMETRY_POOL.submit(
+            self.data_store.search_logs, query="*", filters=log_filters, limit=100
+        )
+
+        # Build the dict once from the results; metrics/events are not
+        # queried here, so they share one immutable empty tuple
+        return {
+            "traces": f_traces.result(),
+            "logs": f_logs.result(),
+            "metrics": _EMPTY,
+            "events": _EMPTY,
+        }
+
+    async def _gather_telemetry_async(
+        self,
+        correlation_id: Optional[str],
+        time_window: TimeRange,
+        services: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Await both telemetry queries concurrently.
+
+        Uses the data store's async_query_traces/async_search_logs when it
+        provides them; legacy synchronous stores fall back to the shared
+        thread pool via run_in_executor, so the event loop never blocks
+        either way.
+        """
+        trace_filters, log_filters = self._telemetry_filters(
+            correlation_id, time_window, services
+        )
+
+        store = self.data_store
+        async_traces = getattr(store, "async_query_traces", None)
+        async_logs = getattr(store, "async_search_logs", None)
+        loop = asyncio.get_running_loop()
+
+        if async_traces is not None:
+            traces_coro = async_traces(filters=trace_filters, limit=100)
+        else:
+            traces_coro = loop.run_in_executor(
+                _TELEMETRY_POOL,
+                functools.partial(store.query_traces, filters=trace_filters, limit=100),
+            )
+        if async_logs is not None:
+            logs_coro = async_logs(query="*", filters=log_filters, limit=100)
+        else:
+            logs_coro = loop.run_in_executor(
+                _TELEMETRY_POOL,
+                functools.partial(store.search_logs, query="*", filters=log_filters, limit=100),
+            )
+
+        traces, logs = await asyncio.gather(traces_coro, logs_coro)
+        return {"traces": traces, "logs": logs, "metrics": _EMPTY, "events": _EMPTY}
 
 
 # Tool registry
@@ -518,3 +884,10 @@ TOOLS = {
         },
     },
 }
+
+# Freeze the registry so handlers cannot mutate the shared schema, and
+# pre-serialize it once: list-tools responses can write these bytes
+# straight to the transport instead of re-walking the nested dicts per
+# request
+TOOLS = MappingProxyType(TOOLS)
+TOOLS_JSON: bytes = dumps_response(dict(TOOLS))